@@ -12,12 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import json
 import os
-from typing import cast, Dict, List, Optional, Sequence, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 from uuid import UUID
-from iqm.iqm_client.iqm_client import Circuit as IQMCircuit
-from iqm.iqm_client.iqm_client import Instruction, IQMClient, Metadata, Status
+
+from types import ModuleType
+
+try:
+    import orjson as _orjson_module
+except ImportError:
+    _orjson: Optional[ModuleType] = None
+else:
+    _orjson = _orjson_module
 import numpy as np
 from pytket.backends import Backend, CircuitStatus, ResultHandle, StatusEnum
 from pytket.backends.backend import KwargTypes
@@ -25,23 +48,8 @@ from pytket.backends.backend_exceptions import CircuitNotRunError
 from pytket.backends.backendinfo import BackendInfo
 from pytket.backends.backendresult import BackendResult
 from pytket.backends.resulthandle import _ResultIdTuple
-from pytket.circuit import Circuit, Node, OpType
+from pytket.circuit import Circuit, Command, Node, OpType, Qubit
 from pytket.extensions.iqm._metadata import __extension_version__
-from pytket.passes import (
-    BasePass,
-    SequencePass,
-    SynthesiseTket,
-    FullPeepholeOptimise,
-    FlattenRegisters,
-    RebaseCustom,
-    DecomposeBoxes,
-    RemoveRedundancies,
-    DefaultMappingPass,
-    DelayMeasures,
-    SimplifyInitial,
-    KAKDecomposition,
-    CliffordSimp,
-)
 from pytket.predicates import (
     ConnectivityPredicate,
     GateSetPredicate,
@@ -57,6 +65,38 @@ from pytket.utils import prepare_circuit
 from pytket.utils.outcomearray import OutcomeArray
 from .config import IQMConfig
 
+# The iqm_client HTTP stack and the pytket passes are deliberately imported at
+# function scope: they are heavy, and importing this module (e.g. just to
+# enumerate available backends) should stay cheap. (numpy is not worth
+# deferring: the OutcomeArray import above already pulls it in.)
+if TYPE_CHECKING:
+    from iqm.iqm_client.iqm_client import Circuit as IQMCircuit
+    from iqm.iqm_client.iqm_client import (
+        Instruction,
+        IQMClient,
+        Metadata,
+        QuantumArchitectureSpecification,
+        RunResult,
+    )
+    from pytket.passes import BasePass
+
+
+# JSON helpers using orjson (a much faster C implementation) when available;
+# postprocessing circuits can serialize to megabytes of JSON. The choice of
+# implementation is made once at import rather than per call.
+if _orjson is not None:
+    _orjson_dumps = _orjson.dumps
+    _json_loads: Callable[[str], Any] = _orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        raw: bytes = _orjson_dumps(obj)
+        return raw.decode()
+
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
 # Mapping of natively supported instructions' names to members of Pytket OpType
 _IQM_PYTKET_OP_MAP = {
     "phased_rx": OpType.PhasedX,
@@ -66,11 +106,19 @@ _IQM_PYTKET_OP_MAP = {
 }
 
 
+# Quantum architectures already fetched in this process, keyed by server URL
+_ARCH_CACHE: Dict[str, QuantumArchitectureSpecification] = {}
+
+
 class IqmAuthenticationError(Exception):
     """Raised when there is no IQM access credentials available."""
 
+    __slots__ = ()
+
+    _MSG = "No IQM access credentials provided or found in config file."
+
     def __init__(self) -> None:
-        super().__init__("No IQM access credentials provided or found in config file.")
+        super().__init__(self._MSG)
 
 
 class IQMBackend(Backend):
@@ -125,25 +173,75 @@ class IQMBackend(Backend):
         if (username is None or password is None) and tokens_file is None:
             raise IqmAuthenticationError()
 
-        if tokens_file is None:
-            self._client = IQMClient(
-                self._url,
-                auth_server_url=auth_server_url,
-                username=username,
-                password=password,
-            )
-        else:
-            self._client = IQMClient(self._url, tokens_file=tokens_file)
-        _iqmqa = self._client.get_quantum_architecture()
+        self._auth_server_url = auth_server_url
+        self._username = username
+        self._password = password
+        self._tokens_file = tokens_file
+
+        # The client and device architecture are fetched lazily, so that
+        # constructing a backend is cheap and does not require network access.
+        self.__client: Optional[IQMClient] = None
+        self._operations: Optional[List[OpType]] = None
+        self._qubits: Optional[List[Node]] = None
+        self._n_qubits: Optional[int] = None
+        self._backendinfo: Optional[BackendInfo] = None
+        self._required_predicates: Optional[List[Predicate]] = None
+        self._compilation_passes: Dict[int, BasePass] = {}
+        self._qm_cache: Dict[Tuple[Qubit, ...], Dict[str, str]] = {}
+        # specialized to the device's operations once they are known
+        self._translate: Callable[[Circuit], Tuple[Instruction, ...]] = _translate_iqm
+        # If the caller supplies a coupling list we can build the architecture
+        # without a round trip to the server; it is validated against the
+        # device qubits when the quantum architecture is first fetched.
+        self._arch_coupling: Optional[List[Tuple[Node, Node]]] = (
+            None if arch is None else [(_as_node(a), _as_node(b)) for (a, b) in arch]
+        )
+        self._arch: Optional[Architecture] = (
+            None if self._arch_coupling is None else Architecture(self._arch_coupling)
+        )
+
+    @property
+    def _client(self) -> IQMClient:
+        from iqm.iqm_client.iqm_client import IQMClient
+
+        if self.__client is None:
+            if self._tokens_file is None:
+                self.__client = IQMClient(
+                    self._url,
+                    auth_server_url=self._auth_server_url,
+                    username=self._username,
+                    password=self._password,
+                )
+            else:
+                self.__client = IQMClient(self._url, tokens_file=self._tokens_file)
+        return self.__client
+
+    def _ensure_arch(self) -> None:
+        if self._backendinfo is not None:
+            return
+        # Quantum architectures are fixed per server, so share one fetch
+        # between all backends pointed at the same URL.
+        _iqmqa = _ARCH_CACHE.get(self._url)
+        if _iqmqa is None:
+            _iqmqa = self._client.get_quantum_architecture()
+            _ARCH_CACHE[self._url] = _iqmqa
         self._operations = [_IQM_PYTKET_OP_MAP[op] for op in _iqmqa.operations]
+        self._translate = _make_translator(tuple(self._operations))
         self._qubits = [_as_node(qb) for qb in _iqmqa.qubits]
         self._n_qubits = len(self._qubits)
-        if arch is None:
-            arch = _iqmqa.qubit_connectivity
-        coupling = [(_as_node(a), _as_node(b)) for (a, b) in arch]
-        if any(qb not in self._qubits for couple in coupling for qb in couple):
-            raise ValueError("Architecture contains qubits not in device")
-        self._arch = Architecture(coupling)
+        coupling = self._arch_coupling
+        if coupling is None:
+            coupling = [
+                (_as_node(a), _as_node(b)) for (a, b) in _iqmqa.qubit_connectivity
+            ]
+        qubit_set = frozenset(self._qubits)
+        bad_qubits = {qb for couple in coupling for qb in couple} - qubit_set
+        if bad_qubits:
+            raise ValueError(
+                f"Architecture contains qubits not in device: {sorted(bad_qubits)}"
+            )
+        if self._arch is None:
+            self._arch = Architecture(coupling)
         self._backendinfo = BackendInfo(
             name=type(self).__name__,
             device_name=_iqmqa.name,
@@ -151,14 +249,9 @@ class IQMBackend(Backend):
             architecture=self._arch,
             gate_set=set(self._operations),
         )
-
-    @property
-    def backend_info(self) -> BackendInfo:
-        return self._backendinfo
-
-    @property
-    def required_predicates(self) -> List[Predicate]:
-        return [
+        # The predicates are pure functions of the (now fixed) architecture
+        # and gate set, so build them once.
+        self._required_predicates = [
             NoClassicalControlPredicate(),
             NoFastFeedforwardPredicate(),
             NoBarriersPredicate(),
@@ -168,11 +261,43 @@ class IQMBackend(Backend):
             ConnectivityPredicate(self._arch),
         ]
 
+    @property
+    def backend_info(self) -> BackendInfo:
+        self._ensure_arch()
+        return cast(BackendInfo, self._backendinfo)
+
+    @property
+    def required_predicates(self) -> List[Predicate]:
+        self._ensure_arch()
+        return cast(List[Predicate], self._required_predicates)
+
     def rebase_pass(self) -> BasePass:
         return _iqm_rebase()
 
     def default_compilation_pass(self, optimisation_level: int = 1) -> BasePass:
         assert optimisation_level in range(3)
+        # The passes are pure functions of the (immutable) architecture, so
+        # each optimisation level is only ever constructed once.
+        cached_pass = self._compilation_passes.get(optimisation_level)
+        if cached_pass is not None:
+            return cached_pass
+        # The architecture supplied at construction time is sufficient here; the
+        # server is only contacted if no architecture override was given.
+        if self._arch is None:
+            self._ensure_arch()
+        from pytket.passes import (
+            CliffordSimp,
+            DecomposeBoxes,
+            DefaultMappingPass,
+            DelayMeasures,
+            FlattenRegisters,
+            FullPeepholeOptimise,
+            KAKDecomposition,
+            RemoveRedundancies,
+            SequencePass,
+            SynthesiseTket,
+        )
+
         passes = [DecomposeBoxes(), FlattenRegisters()]
         if optimisation_level == 0:
             passes.append(self.rebase_pass())  # to satisfy MaxTwoQubitGatesPredicate
@@ -180,19 +305,23 @@ class IQMBackend(Backend):
             passes.append(SynthesiseTket())
         elif optimisation_level == 2:
             passes.append(FullPeepholeOptimise())
-        passes.append(DefaultMappingPass(self._arch))
+        passes.append(DefaultMappingPass(cast(Architecture, self._arch)))
         passes.append(DelayMeasures())
         if optimisation_level == 2:
             passes.append(KAKDecomposition(allow_swaps=False))
             passes.append(CliffordSimp(allow_swaps=False))
             passes.append(SynthesiseTket())
         passes.append(self.rebase_pass())
-        passes.append(RemoveRedundancies())
-        return SequencePass(passes)
+        if optimisation_level > 0:
+            passes.append(RemoveRedundancies())
+        seq_pass = SequencePass(passes)
+        self._compilation_passes[optimisation_level] = seq_pass
+        return seq_pass
 
     @property
     def _result_id_type(self) -> _ResultIdTuple:
-        return (bytes, str)
+        # (run id, postprocessing circuit, index of circuit within the run)
+        return (bytes, str, int)
 
     def process_circuits(
         self,
@@ -211,6 +340,9 @@ class IQMBackend(Backend):
           fidelity of results assuming all qubits initialized to zero (bool, default
           False)
         """
+        from iqm.iqm_client.iqm_client import Circuit as IQMCircuit
+
+        self._ensure_arch()
         circuits = list(circuits)
         n_shots_list = Backend._get_n_shots_as_list(
             n_shots,
@@ -222,32 +354,88 @@ class IQMBackend(Backend):
             self._check_all_circuits(circuits)
 
         postprocess = kwargs.get("postprocess", False)
-        simplify_initial = kwargs.get("postprocess", False)
+        simplify_initial = kwargs.get("simplify_initial", False)
 
-        handles = []
-        for i, (c, n_shots) in enumerate(zip(circuits, n_shots_list)):
+        def _prep(
+            arg: Tuple[int, Circuit],
+        ) -> Tuple[IQMCircuit, Dict[str, str], str, Optional[Circuit]]:
+            i, c = arg
+            ppcirc: Optional[Circuit] = None
             if postprocess:
                 c0, ppcirc = prepare_circuit(c, allow_classical=False, xcirc=_xcirc)
                 ppcirc_rep = ppcirc.to_dict()
             else:
                 c0, ppcirc_rep = c, None
             if simplify_initial:
-                SimplifyInitial(
-                    allow_classical=False, create_all_qubits=True, xcirc=_xcirc
-                ).apply(c0)
-            instrs = _translate_iqm(c0)
-            qm = {str(qb): _as_name(cast(Node, qb)) for qb in c.qubits}
+                _simplify_initial_pass().apply(c0)
+            instrs = self._translate(c0)
+            # circuits over the same qubits (e.g. parameter sweeps) share one
+            # qubit mapping; worst case under the thread pool is a duplicate
+            # computation of the same value
+            qubits = tuple(c.qubits)
+            qm = self._qm_cache.get(qubits)
+            if qm is None:
+                qm = {str(qb): _as_name(cast(Node, qb)) for qb in qubits}
+                self._qm_cache[qubits] = qm
             iqmc = IQMCircuit(
                 name=c.name if c.name else f"circuit_{i}",
                 instructions=instrs,
                 metadata=None,
             )
+            # empty string signals "no postprocessing circuit", saving a JSON
+            # round trip on the common postprocess=False path
+            ppcirc_str = "" if ppcirc_rep is None else _json_dumps(ppcirc_rep)
+            return iqmc, qm, ppcirc_str, ppcirc
+
+        # Per-circuit preparation is independent and spends most of its time in
+        # pytket passes that release the GIL, so prepare in parallel.
+        if len(circuits) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, len(circuits))
+            ) as executor:
+                prepared = list(executor.map(_prep, enumerate(circuits)))
+        else:
+            prepared = [_prep(arg) for arg in enumerate(circuits)]
+        iqmcs = [p[0] for p in prepared]
+        qms = [p[1] for p in prepared]
+        ppcirc_strs = [p[2] for p in prepared]
+        # Submit all circuits that share a shot count as a single batch (not
+        # just consecutive ones), so a job with K distinct shot counts costs K
+        # API calls regardless of size or ordering.
+        batches: Dict[int, List[int]] = {}
+        for i, n_shots in enumerate(n_shots_list):
+            batches.setdefault(n_shots, []).append(i)
+        handles: List[ResultHandle] = [
+            cast(ResultHandle, None) for _ in range(len(circuits))
+        ]
+
+        def _submit(batch: Tuple[int, List[int]]) -> Tuple[List[int], UUID]:
+            n_shots, indices = batch
+            qm: Dict[str, str] = {}
+            for i in indices:
+                qm.update(qms[i])
             run_id = self._client.submit_circuits(
-                [iqmc], qubit_mapping=qm, shots=n_shots
+                [iqmcs[i] for i in indices], qubit_mapping=qm, shots=n_shots
             )
-            handles.append(ResultHandle(run_id.bytes, json.dumps(ppcirc_rep)))
-        for handle in handles:
+            return indices, run_id
+
+        # When there are several batches their submissions are pure I/O, so
+        # overlap them in a small thread pool.
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+                submitted = list(executor.map(_submit, batches.items()))
+        else:
+            submitted = [_submit(batch) for batch in batches.items()]
+        for indices, run_id in submitted:
+            for k, i in enumerate(indices):
+                handles[i] = ResultHandle(run_id.bytes, ppcirc_strs[i], k)
+        for i, handle in enumerate(handles):
             self._cache[handle] = dict()
+            # seed the cache with the in-memory postprocessing circuit, so
+            # result retrieval in this session never re-parses its JSON
+            ppcirc = prepared[i][3]
+            if ppcirc is not None:
+                self._cache[handle]["ppcirc"] = ppcirc
         return handles
 
     def _update_cache_result(
@@ -258,32 +446,93 @@ class IQMBackend(Backend):
         else:
             self._cache[handle] = result_dict
 
-    def circuit_status(self, handle: ResultHandle) -> CircuitStatus:
-        self._check_handle_type(handle)
-        run_id = UUID(bytes=cast(bytes, handle[0]))
-        run_result = self._client.get_run(run_id)
+    def _get_ppcirc(self, handle: ResultHandle) -> Optional[Circuit]:
+        ppcirc_str = cast(str, handle[1])
+        if not ppcirc_str or ppcirc_str == "null":
+            return None
+        if handle in self._cache and "ppcirc" in self._cache[handle]:
+            return cast(Circuit, self._cache[handle]["ppcirc"])
+        ppcirc = Circuit.from_dict(_json_loads(ppcirc_str))
+        self._cache.setdefault(handle, dict())["ppcirc"] = ppcirc
+        return ppcirc
+
+    def _cached_status(self, handle: ResultHandle) -> Optional[CircuitStatus]:
+        # Terminal states are cached, so repeat polls don't hit the server.
+        if handle in self._cache:
+            cached = self._cache[handle]
+            if "result" in cached:
+                return CircuitStatus(StatusEnum.COMPLETED)
+            if "status" in cached:
+                return cast(CircuitStatus, cached["status"])
+        return None
+
+    def _status_from_run_result(
+        self, handle: ResultHandle, run_result: RunResult
+    ) -> CircuitStatus:
+        from iqm.iqm_client.iqm_client import Status
+
         status = run_result.status
         if status == Status.PENDING_EXECUTION:
             return CircuitStatus(StatusEnum.SUBMITTED)
         elif status == Status.READY:
-            measurements = cast(dict, run_result.measurements)[0]
-            shots = OutcomeArray.from_readouts(
-                np.array(
-                    [[r[0] for r in rlist] for cbstr, rlist in measurements.items()],
-                    dtype=int,
+            measurements = cast(dict, run_result.measurements)[cast(int, handle[2])]
+            # one list of single-bit readouts per classical bit; fill a
+            # preallocated C-order (nshots, nbits) array column by column so
+            # no transposed or 3-d intermediate is materialized
+            cols = list(measurements.values())
+            n_bits = len(cols)
+            n_shots = len(cols[0]) if n_bits > 0 else 0
+            arr = np.empty((n_shots, n_bits), dtype=np.uint8)
+            for j, rlist in enumerate(cols):
+                arr[:, j] = np.fromiter(
+                    (r[0] for r in rlist), dtype=np.uint8, count=n_shots
                 )
-                .transpose()
-                .tolist()
-            )
-            ppcirc_rep = json.loads(cast(str, handle[1]))
-            ppcirc = Circuit.from_dict(ppcirc_rep) if ppcirc_rep is not None else None
+            # pack the bits ourselves rather than via from_readouts, which
+            # would make another full pass over the readouts
+            shots = OutcomeArray(np.packbits(arr, axis=1), n_bits)
+            ppcirc = self._get_ppcirc(handle)
             self._update_cache_result(
                 handle, {"result": BackendResult(shots=shots, ppcirc=ppcirc)}
             )
+            # keep the metadata too, so get_metadata is a pure cache hit
+            self._cache[handle]["metadata"] = run_result.metadata
             return CircuitStatus(StatusEnum.COMPLETED)
         else:
             assert status == Status.FAILED
-            return CircuitStatus(StatusEnum.ERROR, cast(str, run_result.message))
+            circuit_status = CircuitStatus(
+                StatusEnum.ERROR, cast(str, run_result.message)
+            )
+            self._cache.setdefault(handle, dict())["status"] = circuit_status
+            return circuit_status
+
+    def circuit_status(self, handle: ResultHandle) -> CircuitStatus:
+        self._check_handle_type(handle)
+        cached_status = self._cached_status(handle)
+        if cached_status is not None:
+            return cached_status
+        run_id = UUID(bytes=cast(bytes, handle[0]))
+        return self._status_from_run_result(handle, self._client.get_run(run_id))
+
+    def circuit_statuses(self, handles: Sequence[ResultHandle]) -> List[CircuitStatus]:
+        """Return the statuses of a batch of handles.
+
+        Handles submitted together share a run, so this polls the server once
+        per distinct run rather than once per handle.
+        """
+        statuses: Dict[ResultHandle, CircuitStatus] = {}
+        by_run: Dict[bytes, List[ResultHandle]] = {}
+        for handle in handles:
+            self._check_handle_type(handle)
+            cached_status = self._cached_status(handle)
+            if cached_status is not None:
+                statuses[handle] = cached_status
+            else:
+                by_run.setdefault(cast(bytes, handle[0]), []).append(handle)
+        for run_bytes, run_handles in by_run.items():
+            run_result = self._client.get_run(UUID(bytes=run_bytes))
+            for handle in run_handles:
+                statuses[handle] = self._status_from_run_result(handle, run_result)
+        return [statuses[handle] for handle in handles]
 
     def get_result(self, handle: ResultHandle, **kwargs: KwargTypes) -> BackendResult:
         """
@@ -294,16 +543,49 @@ class IQMBackend(Backend):
             return super().get_result(handle)
         except CircuitNotRunError:
             timeout = kwargs.get("timeout", 900)
-            # Wait for job to finish; result will then be in the cache.
+            # Wait for job to finish and ingest the returned result directly;
+            # re-polling via circuit_status would repeat the get_run call.
             run_id = UUID(bytes=cast(bytes, handle[0]))
-            self._client.wait_for_results(run_id, timeout_secs=cast(float, timeout))
-            circuit_status = self.circuit_status(handle)
+            run_result = self._client.wait_for_results(
+                run_id, timeout_secs=cast(float, timeout)
+            )
+            circuit_status = self._status_from_run_result(handle, run_result)
             if circuit_status.status is StatusEnum.COMPLETED:
                 return cast(BackendResult, self._cache[handle]["result"])
             else:
                 assert circuit_status.status is StatusEnum.ERROR
                 raise RuntimeError(circuit_status.message)
 
+    def get_results(
+        self, handles: Iterable[ResultHandle], **kwargs: KwargTypes
+    ) -> List[BackendResult]:
+        """
+        See :py:meth:`pytket.backends.Backend.get_results`.
+        Supported kwargs: `timeout` (default 900).
+
+        Handles submitted together share a run; each run is awaited and its
+        measurements ingested once, rather than once per handle.
+        """
+        handles = list(handles)
+        timeout = kwargs.get("timeout", 900)
+        by_run: Dict[bytes, List[ResultHandle]] = {}
+        for handle in handles:
+            self._check_handle_type(handle)
+            if handle not in self._cache or "result" not in self._cache[handle]:
+                by_run.setdefault(cast(bytes, handle[0]), []).append(handle)
+        for run_bytes, run_handles in by_run.items():
+            run_result = self._client.wait_for_results(
+                UUID(bytes=run_bytes), timeout_secs=cast(float, timeout)
+            )
+            for handle in run_handles:
+                circuit_status = self._status_from_run_result(handle, run_result)
+                if circuit_status.status is not StatusEnum.COMPLETED:
+                    assert circuit_status.status is StatusEnum.ERROR
+                    raise RuntimeError(circuit_status.message)
+        return [
+            cast(BackendResult, self._cache[handle]["result"]) for handle in handles
+        ]
+
     def get_metadata(self, handle: ResultHandle, **kwargs: KwargTypes) -> Metadata:
         """Return the metadata corresponding to the handle.
 
@@ -327,17 +609,20 @@ class IQMBackend(Backend):
         """
         self._check_handle_type(handle)
         if handle in self._cache and "metadata" in self._cache[handle]:
-            return cast(Metadata, self._cache[handle]["metadata"])
-        # Wait for job to finish, capture metadata and store it in cache
+            return cast("Metadata", self._cache[handle]["metadata"])
+        # Wait for job to finish and ingest the whole run result, so that a
+        # subsequent get_result for this handle is a pure cache hit.
         timeout = kwargs.get("timeout", 900)
         run_id = UUID(bytes=cast(bytes, handle[0]))
         run_result = self._client.wait_for_results(
             run_id, timeout_secs=cast(float, timeout)
         )
-        self._cache[handle]["metadata"] = run_result.metadata
-        return cast(Metadata, self._cache[handle]["metadata"])
+        self._status_from_run_result(handle, run_result)
+        self._cache.setdefault(handle, dict())["metadata"] = run_result.metadata
+        return cast("Metadata", self._cache[handle]["metadata"])
 
 
+@lru_cache(maxsize=None)
 def _as_node(qname: str) -> Node:
     assert qname.startswith("QB")
     x = int(qname[2:])
@@ -345,47 +630,99 @@ def _as_node(qname: str) -> Node:
     return Node(x - 1)
 
 
+@lru_cache(maxsize=None)
 def _as_name(qnode: Node) -> str:
     assert qnode.reg_name == "node"
     return f"QB{qnode.index[0] + 1}"
 
 
+@lru_cache(maxsize=1)
+def _instruction_builders() -> (
+    Dict[OpType, Callable[[Command, Dict[Qubit, str]], Instruction]]
+):
+    """Instruction builders for the natively supported operations.
+
+    The builders construct Instructions from trusted, already-checked data, so
+    pydantic validation (a large fraction of small-model construction time) is
+    skipped. `model_construct` is the pydantic v2 spelling, `construct` v1.
+    """
+    from iqm.iqm_client.iqm_client import Instruction
+
+    construct: Callable[..., Instruction] = getattr(
+        Instruction, "model_construct", getattr(Instruction, "construct", Instruction)
+    )
+
+    def _build_phased_rx(cmd: Command, qstr: Dict[Qubit, str]) -> Instruction:
+        params = cmd.op.params
+        return construct(
+            name="phased_rx",
+            implementation=None,
+            qubits=(qstr[cmd.qubits[0]],),
+            args={"angle_t": 0.5 * params[0], "phase_t": 0.5 * params[1]},
+        )
+
+    def _build_cz(cmd: Command, qstr: Dict[Qubit, str]) -> Instruction:
+        qbs = cmd.qubits
+        return construct(
+            name="cz",
+            implementation=None,
+            qubits=(qstr[qbs[0]], qstr[qbs[1]]),
+            args={},
+        )
+
+    def _build_measurement(cmd: Command, qstr: Dict[Qubit, str]) -> Instruction:
+        return construct(
+            name="measurement",
+            implementation=None,
+            qubits=(qstr[cmd.qubits[0]],),
+            args={"key": str(cmd.bits[0])},
+        )
+
+    return {
+        OpType.PhasedX: _build_phased_rx,
+        OpType.CZ: _build_cz,
+        OpType.Measure: _build_measurement,
+    }
+
+
+@lru_cache(maxsize=None)
+def _make_translator(
+    operations: Tuple[OpType, ...],
+) -> Callable[[Circuit], Tuple[Instruction, ...]]:
+    """Build a translator specialized to the given supported operations.
+
+    The returned function converts a circuit in the IQM gate set to IQM list
+    representation. Its dispatch table contains only the builders for
+    ``operations``, bound into the closure so the hot loop runs on local
+    lookups.
+    """
+    all_builders = _instruction_builders()
+    builders = {op: all_builders[op] for op in operations if op in all_builders}
+
+    def translate(circ: Circuit) -> Tuple[Instruction, ...]:
+        # stringify each qubit once per circuit rather than once per command
+        qstr = {qb: str(qb) for qb in circ.qubits}
+        # feed the tuple constructor from a generator, iterating the circuit
+        # directly: get_commands() would materialize a list of all commands up
+        # front, and an intermediate instruction list would be copied on the
+        # final tuple() call
+        try:
+            return tuple(builders[cmd.op.type](cmd, qstr) for cmd in circ)
+        except KeyError as err:
+            raise ValueError(f"Unsupported operation type: {err.args[0]}") from err
+
+    return translate
+
+
 def _translate_iqm(circ: Circuit) -> Tuple[Instruction, ...]:
     """Convert a circuit in the IQM gate set to IQM list representation."""
-    instrs = []
-    for cmd in circ.get_commands():
-        op = cmd.op
-        qbs = cmd.qubits
-        cbs = cmd.bits
-        optype = op.type
-        params = op.params
-        if optype == OpType.PhasedX:
-            instr = Instruction(
-                name="phased_rx",
-                implementation=None,
-                qubits=(str(qbs[0]),),
-                args={"angle_t": 0.5 * params[0], "phase_t": 0.5 * params[1]},
-            )
-        elif optype == OpType.CZ:
-            instr = Instruction(
-                name="cz",
-                implementation=None,
-                qubits=(str(qbs[0]), str(qbs[1])),
-                args={},
-            )
-        else:
-            assert optype == OpType.Measure
-            instr = Instruction(
-                name="measurement",
-                implementation=None,
-                qubits=(str(qbs[0]),),
-                args={"key": str(cbs[0])},
-            )
-        instrs.append(instr)
-    return tuple(instrs)
+    return _make_translator(tuple(_instruction_builders()))(circ)
 
 
+@lru_cache(maxsize=1)
 def _iqm_rebase() -> BasePass:
+    from pytket.passes import RebaseCustom
+
     # CX replacement
     c_cx = Circuit(2)
     c_cx.add_gate(OpType.PhasedX, [-0.5, 0.5], [1])
@@ -402,4 +739,11 @@ def _iqm_rebase() -> BasePass:
     return RebaseCustom({OpType.CZ, OpType.PhasedX}, c_cx, c_tk1)
 
 
+@lru_cache(maxsize=1)
+def _simplify_initial_pass() -> BasePass:
+    from pytket.passes import SimplifyInitial
+
+    return SimplifyInitial(allow_classical=False, create_all_qubits=True, xcirc=_xcirc)
+
+
 _xcirc = Circuit(1).add_gate(OpType.PhasedX, [1, 0], [0]).add_phase(0.5)
@@ -12,14 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
-from uuid import UUID
+from typing import Any, List, Optional
+from uuid import UUID, uuid4
 import pytest
 from requests import get
 from conftest import get_demo_url  # type: ignore
-from iqm.iqm_client.iqm_client import ClientAuthenticationError, Metadata, RunRequest
+from iqm.iqm_client.iqm_client import (
+    ClientAuthenticationError,
+    Metadata,
+    RunRequest,
+    Status,
+)
 from pytket.circuit import Circuit
-from pytket.backends import StatusEnum
+from pytket.backends import ResultHandle, StatusEnum
 from pytket.extensions.iqm import IQMBackend
 
 # Skip remote tests if not specified
@@ -47,13 +54,15 @@ def test_iqm(authenticated_iqm_backend: IQMBackend, sample_circuit: Circuit) ->
 
 @pytest.mark.skipif(skip_remote_tests, reason=REASON)
 def test_invalid_cred(demo_url: str) -> None:
+    b = IQMBackend(
+        url=demo_url,
+        auth_server_url="https://demo.qc.iqm.fi/auth",
+        username="invalid",
+        password="invalid",
+    )
+    # The client is constructed lazily, so the error surfaces on first use.
     with pytest.raises(ClientAuthenticationError):
-        _ = IQMBackend(
-            url=demo_url,
-            auth_server_url="https://demo.qc.iqm.fi/auth",
-            username="invalid",
-            password="invalid",
-        )
+        _ = b.backend_info
 
 
 @pytest.mark.skipif(skip_remote_tests, reason=REASON)
@@ -153,3 +162,83 @@ def test_backendinfo(authenticated_iqm_backend: IQMBackend) -> None:
     info = b.backend_info
     assert info.name == type(b).__name__
     assert len(info.gate_set) >= 3
+
+
+# The tests below run without a server: backend construction is lazy and the
+# result-handling helpers are exercised with a stub run result.
+
+
+def _local_backend() -> IQMBackend:
+    return IQMBackend(
+        url="http://localhost",
+        auth_server_url="http://localhost/auth",
+        username="user",
+        password="pass",
+    )
+
+
+class StubRunResult:
+    def __init__(
+        self,
+        status: Status,
+        measurements: Optional[List[dict]] = None,
+        message: Optional[str] = None,
+        metadata: Any = None,
+    ):
+        self.status = status
+        self.measurements = measurements
+        self.message = message
+        self.metadata = metadata
+
+
+def test_handle_roundtrip() -> None:
+    b = _local_backend()
+    assert b._result_id_type == (bytes, str, int)
+    handle = ResultHandle(uuid4().bytes, "", 3)
+    assert ResultHandle.from_str(str(handle)) == handle
+
+
+def test_ppcirc_sentinels() -> None:
+    b = _local_backend()
+    rid = uuid4().bytes
+    assert b._get_ppcirc(ResultHandle(rid, "", 0)) is None
+    # handles created before the empty-string sentinel used "null"
+    assert b._get_ppcirc(ResultHandle(rid, "null", 0)) is None
+    c = Circuit(1).X(0)
+    assert b._get_ppcirc(ResultHandle(rid, json.dumps(c.to_dict()), 0)) == c
+
+
+def test_batch_demux() -> None:
+    b = _local_backend()
+    rid = uuid4()
+    h0 = ResultHandle(rid.bytes, "", 0)
+    h1 = ResultHandle(rid.bytes, "", 1)
+    # stands in for the RunResult the client would return
+    run_result: Any = StubRunResult(
+        Status.READY,
+        measurements=[
+            {"c[0]": [[0], [1], [0]], "c[1]": [[1], [0], [0]]},
+            {"c[0]": [[1], [1], [1]], "c[1]": [[0], [0], [1]]},
+        ],
+    )
+    assert b._status_from_run_result(h0, run_result).status == StatusEnum.COMPLETED
+    assert b._status_from_run_result(h1, run_result).status == StatusEnum.COMPLETED
+    assert b._cache[h0]["result"].get_shots().tolist() == [[0, 1], [1, 0], [0, 0]]
+    assert b._cache[h1]["result"].get_shots().tolist() == [[1, 0], [1, 0], [1, 1]]
+    # completed statuses are now served from the cache, without a server poll
+    assert b.circuit_status(h0).status == StatusEnum.COMPLETED
+    # get_results is likewise a pure cache hit once the run is ingested
+    results = b.get_results([h0, h1])
+    assert results[0] is b._cache[h0]["result"]
+    assert results[1] is b._cache[h1]["result"]
+
+
+def test_failed_status_cached() -> None:
+    b = _local_backend()
+    handle = ResultHandle(uuid4().bytes, "", 0)
+    run_result: Any = StubRunResult(Status.FAILED, message="it broke")
+    status = b._status_from_run_result(handle, run_result)
+    assert status.status == StatusEnum.ERROR
+    assert status.message == "it broke"
+    # the failure is cached, so repeat polls don't need the server either
+    assert b.circuit_status(handle).status == StatusEnum.ERROR